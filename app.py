@@ -7,13 +7,18 @@ Supabase setup:
   2. Configure st.secrets: [supabase] url = "..." key = "..."
 
 SQL tables (see supabase_schema.sql for full DDL):
-  - annotations(annotator_id, poem_id, sentence_id, no_pronoun, pronoun, lemma, person, number, is_dropped, position)
+  - annotations(annotator_id, poem_id, sentence_id, pronoun_index, no_pronoun, pronoun, lemma, person, number, is_dropped, position)
   - poem_perspectives(annotator_id, poem_id, perspective_primary, perspective_secondary, author, poem_date)
 """
+import logging
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from supabase import create_client, Client
 
 # -----------------------------------------------------------------------------
@@ -21,6 +26,8 @@ from supabase import create_client, Client
 # SENTENCE_FILE: local CSV with sentences to annotate.
 # For Streamlit Cloud: add poems_for_manual_annotation.csv to this folder.
 # For local dev: can use parent outputs path as fallback.
+# SENTENCE_PARQUET: optional Parquet copy of the CSV (faster to load); used only while
+# it is at least as new as the CSV, see resolve_sentence_file().
 # -----------------------------------------------------------------------------
 _BASE = os.path.dirname(os.path.abspath(__file__))
 SENTENCE_FILE = os.path.join(_BASE, "poems_for_manual_annotation.csv")
@@ -28,6 +35,13 @@ if not os.path.exists(SENTENCE_FILE):
     _FALLBACK = os.path.join(_BASE, "..", "outputs", "01_pronouns_detection", "poems_for_manual_annotation.csv")
     if os.path.exists(_FALLBACK):
         SENTENCE_FILE = _FALLBACK
+SENTENCE_PARQUET = os.path.join(_BASE, "poems_for_manual_annotation.parquet")
+
+logger = logging.getLogger(__name__)
+_stale_parquet_warned = set()
+
+# Low-cardinality sentence columns stored as pandas categoricals
+CATEGORY_COLUMNS = ["author", "Theme", "Language"]
 
 # Column order for export (matches gpt_annotation_test_result.csv)
 OUTPUT_COLUMNS = [
@@ -41,23 +55,70 @@ PERSON_OPTIONS = ["1st", "2nd", "3rd", "Impersonal"]
 NUMBER_OPTIONS = ["Singular", "Plural", "None"]
 PERSPECTIVE_OPTIONS = ["1st person", "2nd person", "3rd person", "Mixed", "Other"]
 PERSPECTIVE_SECONDARY_OPTIONS = ["None"] + PERSPECTIVE_OPTIONS
+# Perspective labels saved by earlier (Chinese UI) versions; normalized on load
+LEGACY_PERSPECTIVE_MAP = {"第一人称": "1st person", "第二人称": "2nd person", "第三人称": "3rd person", "混合": "Mixed", "其他": "Other", "无": "None"}
 
 
+@st.cache_resource
 def get_supabase() -> Client:
-    """Create Supabase client from st.secrets."""
+    """Create Supabase client from st.secrets (one shared instance per server)."""
     return create_client(
         st.secrets["supabase"]["url"],
         st.secrets["supabase"]["key"],
     )
 
 
-@st.cache_data
-def load_sentences():
-    """Load sentences from local CSV."""
-    df = pd.read_csv(SENTENCE_FILE)
+def resolve_sentence_file() -> str:
+    """SENTENCE_PARQUET if present and not older than the CSV, else SENTENCE_FILE."""
+    if not os.path.exists(SENTENCE_PARQUET):
+        return SENTENCE_FILE
+    if not os.path.exists(SENTENCE_FILE):
+        return SENTENCE_PARQUET
+    parquet_mtime, csv_mtime = os.path.getmtime(SENTENCE_PARQUET), os.path.getmtime(SENTENCE_FILE)
+    if parquet_mtime >= csv_mtime:
+        return SENTENCE_PARQUET
+    if (parquet_mtime, csv_mtime) not in _stale_parquet_warned:
+        _stale_parquet_warned.add((parquet_mtime, csv_mtime))
+        logger.warning("%s is older than %s; loading the CSV. Regenerate the Parquet file (see README).", SENTENCE_PARQUET, SENTENCE_FILE)
+    return SENTENCE_FILE
+
+
+@st.cache_data(max_entries=2)
+def load_sentences(path: str, mtime: float):
+    """Load sentences from local Parquet or CSV. Pass the file mtime so edits to the file invalidate the cache."""
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    for c in CATEGORY_COLUMNS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
     return df.reset_index(drop=True)
 
 
+def filter_sentences(sentences_df: pd.DataFrame, authors: tuple, poem_id: str = "All") -> pd.DataFrame:
+    """Sentences by the given authors (and poem, unless "All"). Not cached: the filter is cheaper than a cache hit."""
+    df = sentences_df[sentences_df["author"].isin(authors)]
+    if poem_id != "All":
+        # Poem ID options are str (poem_sentence_ids keys); compare normalized like the rest of the file
+        df = df[df["ID"].astype(str) == str(poem_id)]
+    return df
+
+
+@st.cache_data(max_entries=64)
+def poem_sentence_ids(_sentences_df: pd.DataFrame, mtime: float, authors: tuple, poem_id: str = "All") -> dict:
+    """poem_id (str) -> set of sentence_ids for filter_sentences(_sentences_df, authors, poem_id).
+
+    _sentences_df is load_sentences() output and is not hashed; mtime (same value passed to
+    load_sentences) stands in for it in the cache key.
+    """
+    df = filter_sentences(_sentences_df, authors, poem_id)
+    out = {}
+    for pid, sid in zip(df["ID"].astype(str), df["sentence_id"].fillna(0).astype(int)):
+        out.setdefault(pid, set()).add(int(sid))
+    return out
+
+
 def load_annotations(annotator_id: str) -> list:
     """Load annotations from Supabase for this annotator."""
     try:
@@ -88,18 +149,24 @@ def load_annotations(annotator_id: str) -> list:
 
 
 def save_annotations_for_sentence(annotator_id: str, poem_id: str, sentence_id: int, records: list):
-    """Delete existing annotations for this sentence, then insert new ones."""
+    """Upsert this sentence's annotations by pronoun_index, then delete any leftover higher slots."""
     try:
         sb = get_supabase()
-        sb.table("annotations").delete().eq("annotator_id", annotator_id).eq(
-            "poem_id", str(poem_id)
-        ).eq("sentence_id", int(sentence_id)).execute()
-        for a in records:
+        rows = []
+        for i, a in enumerate(records):
             row = {
                 "annotator_id": annotator_id,
                 "poem_id": str(a["ID"]),
                 "sentence_id": int(a.get("sentence_id", 0)),
+                "pronoun_index": i,
                 "no_pronoun": bool(a.get("no_pronoun", False)),
+                # Always send every column so an upsert over a previous pronoun row clears it
+                "pronoun": None,
+                "lemma": None,
+                "person": None,
+                "number": None,
+                "is_dropped": None,
+                "position": None,
             }
             if not a.get("no_pronoun"):
                 row.update({
@@ -110,13 +177,25 @@ def save_annotations_for_sentence(annotator_id: str, poem_id: str, sentence_id:
                     "is_dropped": bool(a.get("is_dropped", True)),
                     "position": int(a.get("position", a.get("sentence_id", 0))),
                 })
-            sb.table("annotations").insert(row).execute()
+            rows.append(row)
+        if rows:
+            sb.table("annotations").upsert(
+                rows, on_conflict="annotator_id,poem_id,sentence_id,pronoun_index"
+            ).execute()
+        sb.table("annotations").delete().eq("annotator_id", annotator_id).eq(
+            "poem_id", str(poem_id)
+        ).eq("sentence_id", int(sentence_id)).gte("pronoun_index", len(rows)).execute()
     except Exception as e:
         raise RuntimeError(f"Failed to save annotations: {e}")
 
 
-def get_reviewed_sentences(annotations: list) -> set:
-    return {(str(a["ID"]), int(a.get("sentence_id", 0))) for a in annotations}
+def annotations_key(annotations: list) -> tuple:
+    """Cheap hashable summary of annotations: (poem_id, sentence_id, no_pronoun) per record."""
+    return tuple((str(a["ID"]), int(a.get("sentence_id", 0)), bool(a.get("no_pronoun", False))) for a in annotations)
+
+
+def get_reviewed_sentences(ann_key: tuple) -> set:
+    return {(pid, sid) for pid, sid, _ in ann_key}
 
 
 def load_poem_perspectives(annotator_id: str) -> dict:
@@ -126,19 +205,58 @@ def load_poem_perspectives(annotator_id: str) -> dict:
         r = sb.table("poem_perspectives").select("*").eq("annotator_id", annotator_id).execute()
         rows = r.data or []
         out = {}
+        legacy_rows = []
         for row in rows:
+            primary = row.get("perspective_primary") or ""
+            secondary = row.get("perspective_secondary") or ""
+            primary = LEGACY_PERSPECTIVE_MAP.get(primary, primary)
+            secondary = LEGACY_PERSPECTIVE_MAP.get(secondary, secondary)
+            if secondary == "None":
+                secondary = ""
+            if (primary, secondary) != (row.get("perspective_primary") or "", row.get("perspective_secondary") or ""):
+                legacy_rows.append({
+                    "annotator_id": annotator_id,
+                    "poem_id": str(row["poem_id"]),
+                    "perspective_primary": primary,
+                    "perspective_secondary": secondary,
+                    "author": row.get("author", ""),
+                    "poem_date": row.get("poem_date", ""),
+                })
             out[str(row["poem_id"])] = {
-                "perspective_primary": row.get("perspective_primary", ""),
-                "perspective_secondary": row.get("perspective_secondary", ""),
+                "perspective_primary": primary,
+                "perspective_secondary": secondary,
                 "author": row.get("author", ""),
                 "date": row.get("poem_date", ""),
             }
+        if legacy_rows:
+            # Persist normalized labels once so legacy values stop coming back from the DB
+            try:
+                sb.table("poem_perspectives").upsert(
+                    legacy_rows, on_conflict="annotator_id,poem_id"
+                ).execute()
+            except Exception as e:
+                st.warning(f"Could not update legacy poem perspectives: {e}")
         return out
     except Exception as e:
         st.error(f"Failed to load poem perspectives: {e}")
         return {}
 
 
+def load_annotator_data(annotator_id: str) -> tuple:
+    """Fetch (annotations, poem_perspectives) for this annotator with the two requests in parallel."""
+    ctx = get_script_run_ctx()
+
+    def _run(loader):
+        # Attach the script context so st.error() in the loaders still renders
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return loader(annotator_id)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        annotations = pool.submit(_run, load_annotations)
+        perspectives = pool.submit(_run, load_poem_perspectives)
+        return annotations.result(), perspectives.result()
+
+
 def save_poem_perspective(annotator_id: str, poem_id: str, data: dict):
     """Upsert poem perspective for this annotator."""
     try:
@@ -163,15 +281,35 @@ def _reviewed_key(poem_id, sentence_id) -> tuple:
     return (str(poem_id), int(sentence_id) if pd.notna(sentence_id) else 0)
 
 
-def is_poem_fully_annotated(poem_id: str, display_df: pd.DataFrame, reviewed: set) -> bool:
-    poem_sents = display_df[display_df["ID"].astype(str) == str(poem_id)]
-    if poem_sents.empty:
+def records_key(records: list) -> tuple:
+    """Order-independent key of a sentence's annotation values, for detecting unchanged saves."""
+    return tuple(sorted(
+        (bool(r.get("no_pronoun", False)), str(r.get("pronoun", "")), str(r.get("person", "")),
+         str(r.get("number", "")), bool(r.get("is_dropped", True)))
+        for r in records
+    ))
+
+
+def reviewed_mask(df: pd.DataFrame, reviewed: set) -> pd.Series:
+    """Boolean Series (aligned with df.index): True where the sentence is in the reviewed set."""
+    keys = zip(df["ID"].astype(str), df["sentence_id"].fillna(0).astype(int))
+    return pd.Series([k in reviewed for k in keys], index=df.index, dtype=bool)
+
+
+def is_poem_fully_annotated(poem_id: str, poem_sentences: dict, reviewed: set) -> bool:
+    """poem_sentences: poem_sentence_ids() output for the current filter."""
+    sentence_ids = poem_sentences.get(str(poem_id))
+    if not sentence_ids:
         return False
-    for _, r in poem_sents.iterrows():
-        key = _reviewed_key(r["ID"], r["sentence_id"])
-        if key not in reviewed:
-            return False
-    return True
+    return all((str(poem_id), sid) in reviewed for sid in sentence_ids)
+
+
+def summarize_progress(ann_key: tuple, reviewed: set, display_df: pd.DataFrame) -> tuple:
+    """Sidebar counters in one pass: (done, pronoun_count, poems_done, poems_in_view)."""
+    pronoun_count = sum(1 for *_, no_pronoun in ann_key if not no_pronoun)
+    is_reviewed = reviewed_mask(display_df, reviewed)
+    per_poem = is_reviewed.groupby(display_df["ID"]).all()
+    return int(is_reviewed.sum()), pronoun_count, int(per_poem.sum()), len(per_poem)
 
 
 def pronoun_row_to_output(row: dict, sentence_row: pd.Series) -> dict:
@@ -198,17 +336,34 @@ def pronoun_row_to_output(row: dict, sentence_row: pd.Series) -> dict:
     }
 
 
+def sentence_positions(sentences_df: pd.DataFrame) -> dict:
+    """(ID, sentence_id) -> row position of the first matching sentence row."""
+    positions = {}
+    keys = zip(sentences_df["ID"].astype(str), sentences_df["sentence_id"].fillna(0).astype(int))
+    for pos, key in enumerate(keys):
+        positions.setdefault(key, pos)
+    return positions
+
+
+@st.cache_data(max_entries=2)
+def sentence_keys(_sentences_df: pd.DataFrame, mtime: float) -> set:
+    """All (ID, sentence_id) keys in the sentence file; mtime stands in for the unhashed frame in the cache key."""
+    return set(sentence_positions(_sentences_df))
+
+
 def build_export_csv(annotations: list, sentences_df: pd.DataFrame) -> str:
     """Build CSV content for download (no local file)."""
     pronoun_annots = [a for a in annotations if not a.get("no_pronoun")]
     if not pronoun_annots:
         return ""
+    # Built once instead of masking sentences_df per annotation
+    positions = sentence_positions(sentences_df)
     rows = []
     for a in pronoun_annots:
-        sent = sentences_df[(sentences_df["ID"] == a["ID"]) & (sentences_df["sentence_id"] == a["sentence_id"])]
-        if sent.empty:
+        pos = positions.get(_reviewed_key(a["ID"], a["sentence_id"]))
+        if pos is None:
             continue
-        rows.append(pronoun_row_to_output(a, sent.iloc[0]))
+        rows.append(pronoun_row_to_output(a, sentences_df.iloc[pos]))
     df = pd.DataFrame(rows)
     for c in OUTPUT_COLUMNS:
         if c not in df.columns:
@@ -220,10 +375,12 @@ def build_export_csv(annotations: list, sentences_df: pd.DataFrame) -> str:
 def build_perspectives_csv(perspectives: dict, sentences_df: pd.DataFrame) -> str:
     if not perspectives:
         return ""
+    # ID -> poem text (first sentence row per poem), built once instead of filtering per perspective
+    first_rows = sentences_df.drop_duplicates("ID")
+    ctx_by_id = dict(zip(first_rows["ID"].astype(str), first_rows["context"]))
     rows = []
     for poem_id, data in perspectives.items():
-        meta = sentences_df[sentences_df["ID"].astype(str) == str(poem_id)]
-        context = meta["context"].iloc[0] if not meta.empty else ""
+        context = ctx_by_id.get(str(poem_id), "")
         rows.append({
             "ID": poem_id,
             "author": data.get("author", ""),
@@ -239,8 +396,9 @@ def main():
     st.set_page_config(page_title="Pronoun Annotation", layout="wide")
     st.title("Pronoun Pro-Drop Annotation (Cloud)")
 
-    if not os.path.exists(SENTENCE_FILE):
-        st.error(f"Sentence file not found: {SENTENCE_FILE}. Add poems_for_manual_annotation.csv to the app folder.")
+    sentence_file = resolve_sentence_file()
+    if not os.path.exists(sentence_file):
+        st.error(f"Sentence file not found: {sentence_file}. Add poems_for_manual_annotation.csv (or .parquet) to the app folder.")
         return
 
     st.sidebar.header("Annotator")
@@ -262,25 +420,30 @@ def main():
         st.session_state["nav_idx_input"] = st.session_state.force_nav_idx
         del st.session_state.force_nav_idx
 
-    sentences_df = load_sentences()  # cached
-    if not st.session_state.get("annotations_loaded") or st.session_state.get("annotator_name") != annotator_id:
-        st.session_state.annotations = load_annotations(annotator_id)
-        st.session_state.poem_perspectives = load_poem_perspectives(annotator_id)
-        st.session_state.annotations_loaded = True
-        st.session_state["annotator_name"] = annotator_id
+    sentences_mtime = os.path.getmtime(sentence_file)
+    sentences_df = load_sentences(sentence_file, sentences_mtime)  # cached per file version
+    # Load once per annotator per session ("annotator_name" is already updated above, so track separately)
+    if st.session_state.get("loaded_annotator") != annotator_id:
+        st.session_state.annotations, st.session_state.poem_perspectives = load_annotator_data(annotator_id)
+        # Derived state, kept in sync by _save_sentence_and_reload rather than rebuilt every rerun
+        st.session_state.ann_key = annotations_key(st.session_state.annotations)
+        st.session_state.reviewed = get_reviewed_sentences(st.session_state.ann_key)
+        st.session_state.loaded_annotator = annotator_id
 
-    reviewed = get_reviewed_sentences(st.session_state.annotations)
+    ann_key = st.session_state.ann_key
+    reviewed = st.session_state.reviewed
 
     with st.sidebar:
         st.header("Filter")
         all_authors = sorted(sentences_df["author"].dropna().unique().tolist())
         author_filter = st.multiselect("Author", all_authors, default=all_authors)
-        display_df = sentences_df[sentences_df["author"].isin(author_filter)].copy()
+        display_df = filter_sentences(sentences_df, tuple(author_filter))
 
-        poem_ids = display_df["ID"].unique().tolist()
+        # Unique poem IDs come from the cached per-poem grouping instead of another scan of display_df["ID"]
+        poem_ids = list(poem_sentence_ids(sentences_df, sentences_mtime, tuple(author_filter)))
         poem_id_filter = st.selectbox("Poem ID", ["All"] + sorted(poem_ids, key=str))
         if poem_id_filter != "All":
-            display_df = display_df[display_df["ID"] == poem_id_filter]
+            display_df = filter_sentences(sentences_df, tuple(author_filter), poem_id_filter)
 
         # Direct jump by poem ID (search)
         jump_id = st.text_input("Jump to poem by ID", placeholder="e.g. UP324", key="jump_poem_id")
@@ -295,12 +458,11 @@ def main():
                 st.caption("Poem ID not found in current filter.")
 
         total = len(display_df)
-        done = sum(1 for _, r in display_df.iterrows() if _reviewed_key(r["ID"], r["sentence_id"]) in reviewed)
+        done, pronoun_count, poems_done, poems_in_view = summarize_progress(
+            ann_key, reviewed, display_df
+        )
         st.metric("Sentences", total, f"Annotated {done}")
-        pronoun_count = sum(1 for a in st.session_state.annotations if not a.get("no_pronoun"))
         st.metric("Pronouns annotated", pronoun_count, "")
-        poems_in_view = display_df["ID"].nunique()
-        poems_done = sum(1 for pid in display_df["ID"].unique() if is_poem_fully_annotated(str(pid), display_df, reviewed))
         st.metric("Poems fully annotated", poems_done, f"of {poems_in_view}")
         st.metric("Poem perspectives", len(st.session_state.poem_perspectives), "")
 
@@ -322,7 +484,7 @@ def main():
         return
 
     row = display_df.iloc[idx]
-    sent_key = (str(row["ID"]), int(row["sentence_id"]) if pd.notna(row["sentence_id"]) else 0)
+    sent_key = _reviewed_key(row["ID"], row["sentence_id"])
     key_suffix = f"{row['ID']}_{row['sentence_id']}"
 
     st.subheader(f"Sentence {idx + 1} / {total} · {row['author']} · {row['ID']}")
@@ -345,8 +507,16 @@ def main():
     has_pronoun = st.radio("**Does this sentence have a pronoun?**", ["Yes", "No"], index=default_has, horizontal=True, key=f"has_pronoun_{key_suffix}")
 
     def _save_sentence_and_reload(records: list):
-        save_annotations_for_sentence(annotator_id, str(row["ID"]), int(row["sentence_id"]) if pd.notna(row["sentence_id"]) else 0, records)
-        st.session_state.annotations = load_annotations(annotator_id)
+        save_annotations_for_sentence(annotator_id, sent_key[0], sent_key[1], records)
+        # Replace this sentence's entries in memory instead of re-fetching every annotation
+        st.session_state.annotations = [
+            a for a in st.session_state.annotations
+            if (str(a["ID"]), int(a.get("sentence_id", 0))) != sent_key
+        ] + [{"no_pronoun": False, **r} for r in records]
+        st.session_state.ann_key = annotations_key(st.session_state.annotations)
+        st.session_state.reviewed.discard(sent_key)
+        if records:
+            st.session_state.reviewed.add(sent_key)
 
     if has_pronoun == "Yes":
         if existing_pronouns:
@@ -359,31 +529,16 @@ def main():
 
         pronouns = st.session_state.current_pronouns
 
-        for i, p in enumerate(pronouns):
-            with st.expander(f"Pronoun {i+1}: {p.get('pronoun', '')}", expanded=True):
-                c1, c2 = st.columns(2)
-                with c1:
-                    p["pronoun"] = st.text_input("Ukrainian pronoun", value=p.get("pronoun", ""), key=f"p{i}_ukr_{key_suffix}")
-                with c2:
-                    p["person"] = st.selectbox("Person", PERSON_OPTIONS, index=PERSON_OPTIONS.index(p["person"]) if p.get("person") in PERSON_OPTIONS else 0, key=f"p{i}_person_{key_suffix}")
-                    p["number"] = st.selectbox("Number", NUMBER_OPTIONS, index=NUMBER_OPTIONS.index(p["number"]) if p.get("number") in NUMBER_OPTIONS else 0, key=f"p{i}_num_{key_suffix}")
-                    p["is_dropped"] = st.radio("Pro-drop?", [True, False], index=0 if p.get("is_dropped", True) else 1, horizontal=True, key=f"p{i}_drop_{key_suffix}")
-                if st.button("Delete", key=f"del_{i}_{key_suffix}"):
-                    pronouns.pop(i)
-                    st.session_state.current_sent_key = None
-                    st.rerun()
-
-        if st.button("➕ Add pronoun", key=f"add_pronoun_{key_suffix}"):
-            pronouns.append({"pronoun": "", "person": "1st", "number": "Singular", "is_dropped": True})
-            st.rerun()
+        removed = set()  # row indices ticked "Remove on save", filled in by the form below
 
         def _do_save(and_next: bool):
-            has_valid = any(p.get("pronoun", "").strip() for p in pronouns)
-            if not has_valid and pronouns:
+            kept = [p for i, p in enumerate(pronouns) if i not in removed]
+            has_valid = any(p.get("pronoun", "").strip() for p in kept)
+            if not has_valid and kept:
                 st.warning("Enter at least one pronoun or select 'No'")
                 return
             records = []
-            for p in pronouns:
+            for p in kept:
                 if p.get("pronoun", "").strip():
                     records.append({
                         "ID": str(row["ID"]),
@@ -395,24 +550,50 @@ def main():
                         "is_dropped": bool(p.get("is_dropped", True)),
                         "position": int(row["sentence_id"]) if pd.notna(row["sentence_id"]) else 0,
                     })
-            _save_sentence_and_reload(records)
+            if records_key(records) == records_key(existing):
+                st.toast("No changes to save")
+                if not and_next:
+                    return
+            else:
+                _save_sentence_and_reload(records)
             st.session_state.current_pronouns = []
             st.session_state.current_sent_key = None
+            # Rows are renumbered from the saved state: drop per-row widget values (incl. "Remove on save")
+            for k in [k for k in st.session_state if re.match(rf"p\d+_(ukr|person|num|drop|del)_{re.escape(key_suffix)}$", str(k))]:
+                del st.session_state[k]
             if and_next:
                 next_idx = min(idx + 1, total - 1)
                 st.session_state.force_nav_idx = next_idx
             st.rerun()
 
-        if st.button("💾 Save (stay)", key=f"save_stay_{key_suffix}"):
-            try:
-                _do_save(and_next=False)
-            except Exception as e:
-                st.error(f"Save failed: {e}")
-        if st.button("Save and next", key=f"save_next_{key_suffix}"):
-            try:
-                _do_save(and_next=True)
-            except Exception as e:
-                st.error(f"Save failed: {e}")
+        # Widgets inside the form only rerun the script when one of its submit buttons is pressed.
+        # Enter does not submit, and Save comes first so it is never a destructive action.
+        with st.form(key=f"pronoun_form_{key_suffix}", enter_to_submit=False):
+            for i, p in enumerate(pronouns):
+                with st.expander(f"Pronoun {i+1}: {p.get('pronoun', '')}", expanded=True):
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        p["pronoun"] = st.text_input("Ukrainian pronoun", value=p.get("pronoun", ""), key=f"p{i}_ukr_{key_suffix}")
+                    with c2:
+                        p["person"] = st.selectbox("Person", PERSON_OPTIONS, index=PERSON_OPTIONS.index(p["person"]) if p.get("person") in PERSON_OPTIONS else 0, key=f"p{i}_person_{key_suffix}")
+                        p["number"] = st.selectbox("Number", NUMBER_OPTIONS, index=NUMBER_OPTIONS.index(p["number"]) if p.get("number") in NUMBER_OPTIONS else 0, key=f"p{i}_num_{key_suffix}")
+                        p["is_dropped"] = st.radio("Pro-drop?", [True, False], index=0 if p.get("is_dropped", True) else 1, horizontal=True, key=f"p{i}_drop_{key_suffix}")
+                    if st.checkbox("Remove on save", key=f"p{i}_del_{key_suffix}"):
+                        removed.add(i)
+
+            if st.form_submit_button("💾 Save (stay)"):
+                try:
+                    _do_save(and_next=False)
+                except Exception as e:
+                    st.error(f"Save failed: {e}")
+            if st.form_submit_button("Save and next"):
+                try:
+                    _do_save(and_next=True)
+                except Exception as e:
+                    st.error(f"Save failed: {e}")
+            if st.form_submit_button("➕ Add pronoun"):
+                pronouns.append({"pronoun": "", "person": "1st", "number": "Singular", "is_dropped": True})
+                st.rerun()
 
     else:
         def _do_save_no_pronoun(and_next: bool):
@@ -421,7 +602,12 @@ def main():
                 "sentence_id": int(row["sentence_id"]) if pd.notna(row["sentence_id"]) else 0,
                 "no_pronoun": True,
             }]
-            _save_sentence_and_reload(records)
+            if records_key(records) == records_key(existing):
+                st.toast("No changes to save")
+                if not and_next:
+                    return
+            else:
+                _save_sentence_and_reload(records)
             st.session_state.current_pronouns = []
             st.session_state.current_sent_key = None
             if and_next:
@@ -441,7 +627,8 @@ def main():
                 st.error(f"Save failed: {e}")
 
     poem_id = str(row["ID"])
-    poem_fully_done = is_poem_fully_annotated(poem_id, display_df, reviewed)
+    poem_sentences = poem_sentence_ids(sentences_df, sentences_mtime, tuple(author_filter), poem_id_filter)
+    poem_fully_done = is_poem_fully_annotated(poem_id, poem_sentences, reviewed)
 
     st.divider()
     st.subheader("Poem Perspective")
@@ -452,11 +639,8 @@ def main():
     st.markdown("**Full poem**")
     st.text_area("full_poem", value=row["context"], height=200, disabled=True, key=f"full_poem_{poem_id}", label_visibility="collapsed")
     current = st.session_state.poem_perspectives.get(poem_id, {})
-    primary = current.get("perspective_primary", current.get("perspective", ""))
-    secondary = current.get("perspective_secondary", "")
-    legacy_map = {"第一人称": "1st person", "第二人称": "2nd person", "第三人称": "3rd person", "混合": "Mixed", "其他": "Other", "无": "None"}
-    primary = legacy_map.get(primary, primary)
-    secondary = legacy_map.get(secondary, secondary) if secondary else "None"
+    primary = current.get("perspective_primary", "")
+    secondary = current.get("perspective_secondary") or "None"
     idx_primary = PERSPECTIVE_OPTIONS.index(primary) if primary in PERSPECTIVE_OPTIONS else 0
     idx_secondary = PERSPECTIVE_SECONDARY_OPTIONS.index(secondary) if secondary in PERSPECTIVE_SECONDARY_OPTIONS else 0
     new_primary = st.selectbox("Primary perspective", PERSPECTIVE_OPTIONS, index=idx_primary, key=f"perspective_primary_{poem_id}")
@@ -477,22 +661,26 @@ def main():
 
     st.divider()
     pronoun_annots = [a for a in st.session_state.annotations if not a.get("no_pronoun")]
-    csv_pronoun = build_export_csv(st.session_state.annotations, sentences_df)
-    if csv_pronoun:
+    # CSVs are built only when a download button is clicked (callable data, run off the script thread)
+    annotations = st.session_state.annotations
+    perspectives = st.session_state.poem_perspectives
+    # Same match build_export_csv applies, so the button never downloads an empty file
+    known_sentences = sentence_keys(sentences_df, sentences_mtime)
+    has_exportable = any(_reviewed_key(a["ID"], a["sentence_id"]) in known_sentences for a in pronoun_annots)
+    if has_exportable:
         st.download_button(
             "Download pronoun annotations (CSV)",
-            csv_pronoun,
+            lambda: build_export_csv(annotations, sentences_df),
             file_name=f"manual_annotation_result_{annotator_id.replace(' ', '_')}.csv",
             mime="text/csv",
         )
     else:
         st.caption("No pronoun annotations to download yet")
 
-    csv_persp = build_perspectives_csv(st.session_state.poem_perspectives, sentences_df)
-    if csv_persp:
+    if perspectives:
         st.download_button(
             "Download poem perspectives (CSV)",
-            csv_persp,
+            lambda: build_perspectives_csv(perspectives, sentences_df),
             file_name=f"manual_annotation_poem_perspectives_{annotator_id.replace(' ', '_')}.csv",
             mime="text/csv",
         )
@@ -501,9 +689,9 @@ def main():
 
     with st.expander("Preview annotations"):
         if pronoun_annots:
-            preview = pd.DataFrame(pronoun_annots[-100:])
             cols = ["ID", "sentence_id", "pronoun", "person", "is_dropped"]
-            st.dataframe(preview[[c for c in cols if c in preview.columns]], width="stretch")
+            preview = [{c: a.get(c, "") for c in cols} for a in pronoun_annots[-100:]]
+            st.dataframe(pd.DataFrame(preview, columns=cols), width="stretch")
         else:
             st.info("No annotations yet")
     with st.expander("Preview poem perspectives"):
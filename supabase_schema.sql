@@ -10,6 +10,7 @@ CREATE TABLE IF NOT EXISTS annotations (
     annotator_id TEXT NOT NULL,
     poem_id TEXT NOT NULL,
     sentence_id INTEGER NOT NULL,
+    pronoun_index INTEGER NOT NULL DEFAULT 0,
     no_pronoun BOOLEAN DEFAULT FALSE,
     pronoun TEXT,
     lemma TEXT,
@@ -20,9 +21,30 @@ CREATE TABLE IF NOT EXISTS annotations (
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Upgrade for tables created before pronoun_index existed. Idempotent: safe to re-run.
+-- Existing rows get the column with default 0; sentences with several pronoun rows are
+-- then renumbered 0..K-1 so the unique index below can be created.
+ALTER TABLE annotations ADD COLUMN IF NOT EXISTS pronoun_index INTEGER NOT NULL DEFAULT 0;
+UPDATE annotations a SET pronoun_index = n.rn - 1
+FROM (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY annotator_id, poem_id, sentence_id ORDER BY pronoun_index, created_at, id
+    ) AS rn
+    FROM annotations
+    WHERE (annotator_id, poem_id, sentence_id) IN (
+        SELECT annotator_id, poem_id, sentence_id
+        FROM annotations
+        GROUP BY annotator_id, poem_id, sentence_id
+        HAVING COUNT(*) > COUNT(DISTINCT pronoun_index)
+    )
+) n
+WHERE a.id = n.id AND a.pronoun_index <> n.rn - 1;
+
 CREATE INDEX IF NOT EXISTS idx_annotations_annotator ON annotations(annotator_id);
 CREATE INDEX IF NOT EXISTS idx_annotations_annotator_poem ON annotations(annotator_id, poem_id);
 CREATE INDEX IF NOT EXISTS idx_annotations_annotator_poem_sent ON annotations(annotator_id, poem_id, sentence_id);
+-- One row per (sentence, pronoun slot); the app upserts annotations on this key.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_annotations_sentence_slot ON annotations(annotator_id, poem_id, sentence_id, pronoun_index);
 
 -- Table: poem_perspectives
 -- Stores poem-level perspective judgments per annotator.